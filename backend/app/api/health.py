@@ -1,8 +1,10 @@
+from typing import Dict
+
 from fastapi import APIRouter
 
 router = APIRouter(tags=["Health"])
 
 
-@router.get("/health")
-async def healths():
+@router.get("/health", response_model=Dict[str, str])
+async def healths() -> Dict[str, str]:
     return {"status": "ok"}
@@ -1,11 +1,14 @@
+import asyncio
+import functools
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.core.cache import stats_cache
+from app.core.config import settings
+from app.db.base import get_db_ro
 from app.db.crud import search_restaurants as db_search_restaurants
-from app.db.models import RestaurantDB
 from app.models.restaurant import Restaurant
 from app.schemas.restaurants import PickRequest, RestaurantOut
 from app.services.picker import pick_restaurants
@@ -19,6 +22,7 @@ router = APIRouter(
 @router.get(
     "/search",
     response_model=List[RestaurantOut],
+    response_model_exclude_none=True,
     summary="Search restaurants from database",
 )
 async def search_restaurants(
@@ -45,7 +49,7 @@ async def search_restaurants(
         le=50,
         description="Maximum number of restaurants to return",
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> List[RestaurantOut]:
     """
     Search for restaurants in the database.
@@ -53,7 +57,7 @@ async def search_restaurants(
     This searches your local database instead of external APIs,
     making it much faster and avoiding rate limits.
     """
-    db_restaurants: List[RestaurantDB] = await db_search_restaurants(
+    rows = await db_search_restaurants(
         db=db,
         location=location,
         cuisine=cuisine,
@@ -63,17 +67,19 @@ async def search_restaurants(
     )
 
     # Convert to response models
-    return [RestaurantOut(**r.to_dict()) for r in db_restaurants]
+    return [RestaurantOut.from_db(row) for row in rows]
 
 
 @router.post(
     "/pick",
-    response_model=List[RestaurantOut],
+    response_model=List[Restaurant],
+    response_model_exclude_none=True,
     summary="Pick best restaurant options from candidates",
 )
 async def pick(
     body: PickRequest,
-) -> List[RestaurantOut]:
+    request: Request,
+) -> List[Restaurant]:
     """
     Given a list of candidate restaurants, pick the best ones.
 
@@ -81,22 +87,34 @@ async def pick(
     1. Call /restaurants/search to get candidates from database.
     2. Send candidates to /restaurants/pick to get final suggestions.
     """
-    chosen: List[Restaurant] = pick_restaurants(
+    run_pick = functools.partial(
+        pick_restaurants,
         restaurants=body.candidates,
         limit=body.limit,
         strategy=body.strategy,
     )
-    return [RestaurantOut(**r.model_dump()) for r in chosen]
+    # Scoring is CPU-bound; keep large batches off the event loop, in the
+    # pool created by the app lifespan (the default executor if it has not run)
+    chosen: List[Restaurant]
+    if len(body.candidates) > settings.pick_offload_threshold:
+        executor = getattr(request.app.state, "pick_executor", None)
+        chosen = await asyncio.get_running_loop().run_in_executor(executor, run_pick)
+    else:
+        chosen = run_pick()
+
+    # Candidates were validated on the way in; return them as-is
+    return chosen
 
 
 @router.get(
     "/{restaurant_id}",
     response_model=RestaurantOut,
+    response_model_exclude_none=True,
     summary="Get a specific restaurant by ID",
 )
 async def get_restaurant(
     restaurant_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> RestaurantOut:
     """Get details for a specific restaurant."""
     from app.db.crud import get_restaurant as db_get_restaurant
@@ -105,7 +123,7 @@ async def get_restaurant(
     if db_restaurant is None:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    return RestaurantOut(**db_restaurant.to_dict())
+    return RestaurantOut.from_db(db_restaurant)
 
 
 @router.get(
@@ -114,12 +132,16 @@ async def get_restaurant(
     summary="Get list of all available cuisines",
 )
 async def get_cuisines(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> List[str]:
     """Get a list of all unique cuisines in the database."""
     from app.db.crud import get_cuisines as db_get_cuisines
 
-    return await db_get_cuisines(db)
+    cuisines = stats_cache.get("cuisines")
+    if cuisines is None:
+        cuisines = await db_get_cuisines(db)
+        stats_cache.set("cuisines", cuisines)
+    return cuisines
 
 
 @router.get(
@@ -128,9 +150,13 @@ async def get_cuisines(
     summary="Get list of all available cities",
 )
 async def get_cities(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> List[str]:
     """Get a list of all cities with restaurants in the database."""
     from app.db.crud import get_cities as db_get_cities
 
-    return await db_get_cities(db)
+    cities = stats_cache.get("cities")
+    if cities is None:
+        cities = await db_get_cities(db)
+        stats_cache.set("cities", cities)
+    return cities
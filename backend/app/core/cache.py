@@ -0,0 +1,45 @@
+"""
+Small in-process TTL cache for query results that change rarely.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """
+    Dictionary cache whose entries expire after a fixed number of seconds.
+
+    Each worker process holds its own copy, so writers should call clear()
+    and readers must tolerate results up to `ttl_seconds` old.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for `key`, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value` under `key` for `ttl_seconds`."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+# Results of the /restaurants/stats/* endpoints (distinct cuisines/cities)
+stats_cache = TTLCache(ttl_seconds=settings.stats_cache_ttl_seconds)
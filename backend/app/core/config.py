@@ -8,6 +8,18 @@ class Settings(BaseSettings):
     # Database settings
     database_url: str = "sqlite+aiosqlite:///./restaurant_picker.db"
     database_echo: bool = False  # Set to True to see SQL queries in logs
+    # Connection pool: one long-lived connection plus a few overflow readers
+    database_pool_size: int = 1
+    database_max_overflow: int = 4
+    database_pool_recycle: int = 3600  # seconds
+
+    # How long /restaurants/stats/* results are cached in memory
+    stats_cache_ttl_seconds: int = 300
+
+    # /restaurants/pick runs in a worker thread above this many candidates
+    pick_offload_threshold: int = 500
+    # Threads in the pool that runs those picks
+    pick_executor_max_workers: int = 4
 
     class Config:
         env_file = ".env"
@@ -2,18 +2,59 @@
 Database base configuration and session management.
 """
 
+from sqlalchemy import event, text
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
 # Create async engine
+# Pooled connections are reused across requests, so each request skips
+# opening the file and starting an aiosqlite worker thread, and SQLite's
+# per-connection page cache stays warm.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_recycle=settings.database_pool_recycle,
+    pool_pre_ping=False,
+    connect_args=(
+        {"check_same_thread": False}
+        if settings.database_url.startswith("sqlite")
+        else {}
+    ),
 )
 
+# Per-connection SQLite tuning: WAL lets readers run alongside a writer,
+# synchronous=NORMAL is durable under WAL with a single fsync per checkpoint,
+# and the larger page cache / mmap keep hot b-tree pages out of read() calls.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA foreign_keys=ON",
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Apply SQLITE_PRAGMAS to every new DBAPI connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -24,6 +65,16 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Session factory for read-only work. AUTOCOMMIT means no transaction is
+# opened, so there is nothing to commit (or fsync) when the session ends.
+AsyncReadSessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
 # Base class for all models
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -31,14 +82,30 @@ class Base(DeclarativeBase):
     pass
 
 
-# Dependency to get database session
-async def get_db() -> AsyncSession:
+# Dependency to get a read-only database session
+async def get_db_ro() -> AsyncSession:
     """
-    Dependency that provides a database session.
+    Dependency that provides a session for endpoints that only read.
+
+    Nothing is committed on exit; use get_db_rw for anything that writes.
 
     Usage in FastAPI:
         @app.get("/items")
-        async def get_items(db: AsyncSession = Depends(get_db)):
+        async def get_items(db: AsyncSession = Depends(get_db_ro)):
+            ...
+    """
+    async with AsyncReadSessionLocal() as session:
+        yield session
+
+
+# Dependency to get a read-write database session
+async def get_db_rw() -> AsyncSession:
+    """
+    Dependency that provides a database session committed on success.
+
+    Usage in FastAPI:
+        @app.post("/items")
+        async def create_item(db: AsyncSession = Depends(get_db_rw)):
             ...
     """
     async with AsyncSessionLocal() as session:
@@ -52,15 +119,91 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+# SQLite FTS5 index over the text columns used by location search.
+# It is an external-content table: rows live in `restaurants` and the
+# triggers below keep the index in sync. The index is keyed on the implicit
+# rowid of `restaurants` (its primary key is TEXT), which VACUUM may
+# renumber; init_db therefore rebuilds it on every start, and a VACUUM at
+# runtime must be followed by
+# "INSERT INTO restaurants_fts(restaurants_fts) VALUES ('rebuild')".
+FTS_TABLE_DDL = """
+CREATE VIRTUAL TABLE restaurants_fts USING fts5(
+    name, address, city,
+    content='restaurants', content_rowid='rowid', tokenize='unicode61'
+)
+"""
+
+FTS_TRIGGERS_DDL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS restaurants_fts_ai AFTER INSERT ON restaurants BEGIN
+        INSERT INTO restaurants_fts(rowid, name, address, city)
+        VALUES (new.rowid, new.name, new.address, new.city);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS restaurants_fts_ad AFTER DELETE ON restaurants BEGIN
+        INSERT INTO restaurants_fts(restaurants_fts, rowid, name, address, city)
+        VALUES ('delete', old.rowid, old.name, old.address, old.city);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS restaurants_fts_au
+    AFTER UPDATE OF name, address, city ON restaurants BEGIN
+        INSERT INTO restaurants_fts(restaurants_fts, rowid, name, address, city)
+        VALUES ('delete', old.rowid, old.name, old.address, old.city);
+        INSERT INTO restaurants_fts(rowid, name, address, city)
+        VALUES (new.rowid, new.name, new.address, new.city);
+    END
+    """,
+)
+
+
+# Indexes from earlier schemas that are now covered by others:
+# lat by ix_restaurants_lat_lng, cuisine by ix_restaurants_cuisine_rank
+REPLACED_INDEXES = ("ix_restaurants_lat", "ix_restaurants_cuisine")
+
+
 # Helper function to initialize database
 async def init_db() -> None:
-    """Create all tables in the database."""
+    """Create all tables in the database and backfill derived columns."""
+    # Imported here: crud imports the models, which import this module
+    from app.db.crud import backfill_cities
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all skips tables that already exist, so add indexes that are
+        # newer than the database, and drop the ones they replaced
+        # (IF NOT EXISTS rather than checkfirst: SQLite cannot reflect
+        # expression indexes, so checkfirst would not see them)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                await conn.execute(CreateIndex(index, if_not_exists=True))
+        for name in REPLACED_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        await backfill_cities(conn)
+
+        if conn.dialect.name == "sqlite":
+            exists = await conn.scalar(
+                text(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'restaurants_fts'"
+                )
+            )
+            if not exists:
+                await conn.execute(text(FTS_TABLE_DDL))
+            # Re-index from scratch: picks up rows inserted before the FTS
+            # table existed, and rowids renumbered by a VACUUM since last run
+            await conn.execute(
+                text("INSERT INTO restaurants_fts(restaurants_fts) VALUES ('rebuild')")
+            )
+            for ddl in FTS_TRIGGERS_DDL:
+                await conn.execute(text(ddl))
 
 
 # Helper function to drop all tables (for testing)
 async def drop_db() -> None:
     """Drop all tables in the database."""
     async with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            await conn.execute(text("DROP TABLE IF EXISTS restaurants_fts"))
         await conn.run_sync(Base.metadata.drop_all)
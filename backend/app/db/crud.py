@@ -2,13 +2,130 @@
 CRUD (Create, Read, Update, Delete) operations for Restaurant model.
 """
 
-from typing import List, Optional
+import csv
+import io
+import math
+import re
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import (
+    Row,
+    Select,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.cache import stats_cache
+from app.db.models import RestaurantDB, restaurants_fts
+from app.models.restaurant import Restaurant
 
-from sqlalchemy import func, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+# Field order of the row tuples taken by bulk_copy_restaurants
+RESTAURANT_ROW_FIELDS = tuple(Restaurant.model_fields)
+# Columns bulk_copy_restaurants writes: the row fields plus derived values
+COPY_COLUMNS = RESTAURANT_ROW_FIELDS + ("city", "created_at", "updated_at")
+_ADDRESS_INDEX = RESTAURANT_ROW_FIELDS.index("address")
+# Address parts after the city that _city_from_address skips: a country, and
+# a US state and/or ZIP code ("IL", "IL 62704", "Illinois 62704", "62704")
+_COUNTRY_NAMES = frozenset(
+    {"us", "usa", "u.s.", "u.s.a.", "united states", "united states of america"}
+)
+_STATE_ZIP_RE = re.compile(r"[A-Z]{2}|(?:[A-Za-z. ]+ )?\d{5}(?:-\d{4})?")
+# Rows handed to the database per COPY buffer / executemany call, which
+# bounds the memory a bulk load holds at once
+COPY_CHUNK_SIZE = 10_000
+# Rows per multi-row INSERT ... VALUES statement on SQLite. 500 rows x 14
+# columns stays under the bound-parameter limit of SQLite 3.32+ (32766).
+SQLITE_INSERT_PAGE_SIZE = 500
+# Defaults for fields a plain dict passed to bulk_create_restaurants may omit
+_ROW_DEFAULTS = {
+    name: None if field.is_required() else field.default
+    for name, field in Restaurant.model_fields.items()
+}
+
+# Columns exposed through the API schema. List queries select just these, so
+# rows come back as lightweight Row tuples instead of full ORM instances.
+RESTAURANT_OUT_COLUMNS = (
+    RestaurantDB.id,
+    RestaurantDB.name,
+    RestaurantDB.address,
+    RestaurantDB.lat,
+    RestaurantDB.lng,
+    RestaurantDB.rating,
+    RestaurantDB.price_level,
+    RestaurantDB.cuisine,
+    RestaurantDB.source,
+    RestaurantDB.url,
+    RestaurantDB.num_reviews,
+)
+
+
+def _city_from_address(address: str) -> Optional[str]:
+    """
+    Derive the city from a comma-separated address.
 
-from app.db.models import RestaurantDB
-from app.models.restaurant import Restaurant
+    A trailing country and a trailing US state / ZIP part are skipped, so
+    "3 Oak Ave, Springfield, IL 62704, USA" gives "Springfield". Without a
+    state / ZIP part only the "<street>, <city>" form is trusted; longer
+    addresses are ambiguous (e.g. "1 Rue X, Paris, France") and give None.
+
+    Args:
+        address: Full address, e.g. "12 Main St, Boston"
+
+    Returns:
+        City name, or None if it cannot be told apart from the other parts
+    """
+    parts = [part.strip() for part in address.split(",")]
+    if parts[-1].lower() in _COUNTRY_NAMES:
+        parts.pop()
+    if parts and _STATE_ZIP_RE.fullmatch(parts[-1]):
+        parts.pop()
+    elif len(parts) != 2:
+        return None
+
+    city = parts[-1] if parts else ""
+    # Digits mean a street, unit or postcode rather than a city
+    if not city or any(char.isdigit() for char in city):
+        return None
+    return city
+
+
+async def backfill_cities(conn: AsyncConnection) -> int:
+    """
+    Derive city for rows stored without one (e.g. before it was populated).
+
+    Args:
+        conn: Connection inside the caller's transaction
+
+    Returns:
+        Number of rows updated
+    """
+    table = RestaurantDB.__table__
+    result = await conn.execute(
+        select(table.c.id, table.c.address).where(table.c.city.is_(None))
+    )
+    updates = [
+        {"row_id": row_id, "row_city": city}
+        for row_id, address in result
+        if (city := _city_from_address(address))
+    ]
+    if updates:
+        await conn.execute(
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values(city=bindparam("row_city")),
+            updates,
+        )
+    return len(updates)
 
 
 async def create_restaurant(db: AsyncSession, restaurant: Restaurant) -> RestaurantDB:
@@ -34,9 +151,11 @@ async def create_restaurant(db: AsyncSession, restaurant: Restaurant) -> Restaur
         source=restaurant.source,
         url=restaurant.url,
         num_reviews=restaurant.num_reviews,
+        city=_city_from_address(restaurant.address),
     )
     db.add(db_restaurant)
     await db.commit()
+    stats_cache.clear()
     await db.refresh(db_restaurant)
     return db_restaurant
 
@@ -54,10 +173,8 @@ async def get_restaurant(
     Returns:
         RestaurantDB instance or None if not found
     """
-    result = await db.execute(
-        select(RestaurantDB).where(RestaurantDB.id == restaurant_id)
-    )
-    return result.scalar_one_or_none()
+    # Primary-key fast path: checks the identity map before querying
+    return await db.get(RestaurantDB, restaurant_id)
 
 
 async def get_restaurants(
@@ -80,6 +197,81 @@ async def get_restaurants(
     return list(result.scalars().all())
 
 
+def _fts_prefix_phrase(value: str) -> str:
+    """
+    Build an FTS5 query matching `value` as a phrase whose last word may be
+    a prefix (so "new yo" matches "New York").
+
+    Args:
+        value: Raw user input
+
+    Returns:
+        FTS5 MATCH expression with quotes escaped
+    """
+    return '"' + value.replace('"', '""') + '" *'
+
+
+@lru_cache(maxsize=None)
+def _search_query(
+    location_mode: Optional[str],
+    has_cuisine: bool,
+    has_min_rating: bool,
+    has_max_price_level: bool,
+) -> Select:
+    """
+    Build the search_restaurants statement for one combination of filters.
+
+    Filter values are bind parameters, so each of the few possible shapes is
+    built once and reused, and SQLAlchemy compiles its SQL only once.
+
+    Args:
+        location_mode: "city" (exact, case-insensitive city), "fts" (SQLite
+            FTS5 MATCH), "like" or None
+        has_cuisine: Filter on lower(cuisine) == :cuisine
+        has_min_rating: Filter on rating >= :min_rating
+        has_max_price_level: Filter on price_level <= :max_price_level
+
+    Returns:
+        Select taking the bound parameters above plus :limit
+    """
+    query = select(*RESTAURANT_OUT_COLUMNS)
+
+    if location_mode == "city":
+        query = query.where(func.lower(RestaurantDB.city) == bindparam("location"))
+    elif location_mode == "fts":
+        query = query.join(
+            restaurants_fts,
+            restaurants_fts.c.rowid == literal_column("restaurants.rowid"),
+        ).where(restaurants_fts.c.restaurants_fts.match(bindparam("location")))
+    elif location_mode == "like":
+        location = bindparam("location")
+        query = query.where(
+            or_(
+                func.lower(RestaurantDB.city).like(location),
+                func.lower(RestaurantDB.address).like(location),
+                func.lower(RestaurantDB.name).like(location),
+            )
+        )
+
+    # Cuisine filter
+    if has_cuisine:
+        query = query.where(func.lower(RestaurantDB.cuisine) == bindparam("cuisine"))
+
+    # Rating filter
+    if has_min_rating:
+        query = query.where(RestaurantDB.rating >= bindparam("min_rating"))
+
+    # Price level filter
+    if has_max_price_level:
+        query = query.where(RestaurantDB.price_level <= bindparam("max_price_level"))
+
+    # Order by rating (highest first), then by number of reviews
+    return query.order_by(
+        RestaurantDB.rating.desc().nulls_last(),
+        RestaurantDB.num_reviews.desc().nulls_last(),
+    ).limit(bindparam("limit"))
+
+
 async def search_restaurants(
     db: AsyncSession,
     location: Optional[str] = None,
@@ -87,57 +279,65 @@ async def search_restaurants(
     min_rating: Optional[float] = None,
     max_price_level: Optional[int] = None,
     limit: int = 20,
-) -> List[RestaurantDB]:
+) -> List[Row]:
     """
     Search restaurants with filters.
 
     Args:
         db: Database session
-        location: City or location name (searches in city, address, name)
+        location: City or location name. Exact (case-insensitive) city
+            matches come first, followed by rows matching the words in
+            city, address or name (using the FTS5 index on SQLite)
         cuisine: Cuisine type (case-insensitive)
         min_rating: Minimum rating filter
         max_price_level: Maximum price level (1-4)
         limit: Maximum number of results
 
     Returns:
-        List of matching RestaurantDB instances
+        List of matching rows with the RESTAURANT_OUT_COLUMNS fields
     """
-    query = select(RestaurantDB)
-
-    # Location filter - search in city, address, or name
-    if location:
-        location_lower = f"%{location.lower()}%"
-        query = query.where(
-            or_(
-                func.lower(RestaurantDB.city).like(location_lower),
-                func.lower(RestaurantDB.address).like(location_lower),
-                func.lower(RestaurantDB.name).like(location_lower),
-            )
-        )
-
-    # Cuisine filter
+    params: Dict[str, Any] = {"limit": limit}
     if cuisine:
-        query = query.where(func.lower(RestaurantDB.cuisine) == cuisine.lower())
-
-    # Rating filter
+        params["cuisine"] = cuisine.lower()
     if min_rating is not None:
-        query = query.where(RestaurantDB.rating >= min_rating)
-
-    # Price level filter
+        params["min_rating"] = min_rating
     if max_price_level is not None:
-        query = query.where(RestaurantDB.price_level <= max_price_level)
+        params["max_price_level"] = max_price_level
 
-    # Order by rating (highest first), then by number of reviews
-    query = query.order_by(
-        RestaurantDB.rating.desc().nulls_last(),
-        RestaurantDB.num_reviews.desc().nulls_last(),
-    )
+    filters = {
+        "has_cuisine": bool(cuisine),
+        "has_min_rating": min_rating is not None,
+        "has_max_price_level": max_price_level is not None,
+    }
 
-    # Apply limit
-    query = query.limit(limit)
+    location = location.strip() if location else None
+    if not location:
+        result = await db.execute(_search_query(None, **filters), params)
+        return list(result.all())
 
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    # Exact city match first: an index seek on lower(city)
+    result = await db.execute(
+        _search_query("city", **filters), {**params, "location": location.lower()}
+    )
+    rows = list(result.all())
+    if len(rows) >= limit:
+        return rows
+
+    # Top up by searching words in city, address, or name. This also finds
+    # rows whose city could not be derived from the address (city is NULL).
+    if db.get_bind().dialect.name == "sqlite":
+        query = _search_query("fts", **filters)
+        params["location"] = _fts_prefix_phrase(location)
+    else:
+        query = _search_query("like", **filters)
+        params["location"] = f"%{location.lower()}%"
+    # Ask for enough rows to fill the page even if every exact match repeats
+    params["limit"] = limit + len(rows)
+
+    result = await db.execute(query, params)
+    seen = {row.id for row in rows}
+    rows.extend(row for row in result if row.id not in seen)
+    return rows[:limit]
 
 
 async def search_restaurants_near_point(
@@ -172,8 +372,9 @@ async def search_restaurants_near_point(
     # Simple bounding box filter first (much faster than haversine)
     # Approximate: 1 degree latitude ≈ 111 km
     lat_delta = radius_km / 111.0
-    # Longitude varies by latitude, rough approximation
-    lng_delta = radius_km / (111.0 * abs(func.cos(func.radians(lat))))
+    # Longitude varies by latitude, rough approximation. Computed once in
+    # Python so the WHERE below is plain BETWEENs on the (lat, lng) index.
+    lng_delta = radius_km / (111.0 * max(abs(math.cos(math.radians(lat))), 1e-6))
 
     query = select(RestaurantDB).where(
         RestaurantDB.lat.between(lat - lat_delta, lat + lat_delta),
@@ -214,21 +415,30 @@ async def update_restaurant(
     Args:
         db: Database session
         restaurant_id: Restaurant ID
-        **kwargs: Fields to update
+        **kwargs: Fields to update; changing address also re-derives city
 
     Returns:
         Updated RestaurantDB instance or None if not found
     """
-    db_restaurant = await get_restaurant(db, restaurant_id)
-    if db_restaurant is None:
-        return None
-
-    for key, value in kwargs.items():
-        if hasattr(db_restaurant, key):
-            setattr(db_restaurant, key, value)
-
+    columns = RestaurantDB.__table__.columns
+    values = {key: value for key, value in kwargs.items() if key in columns}
+    if not values:
+        return await get_restaurant(db, restaurant_id)
+    if "address" in values:
+        # Keep the derived city in step unless the caller sets it explicitly
+        values.setdefault("city", _city_from_address(values["address"]))
+
+    # Single UPDATE ... RETURNING: existence check and write in one statement
+    result = await db.execute(
+        update(RestaurantDB)
+        .where(RestaurantDB.id == restaurant_id)
+        .values(**values)
+        .returning(RestaurantDB)
+        .execution_options(populate_existing=True)
+    )
+    db_restaurant = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(db_restaurant)
+    stats_cache.clear()
     return db_restaurant
 
 
@@ -243,49 +453,208 @@ async def delete_restaurant(db: AsyncSession, restaurant_id: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    db_restaurant = await get_restaurant(db, restaurant_id)
-    if db_restaurant is None:
-        return False
-
-    await db.delete(db_restaurant)
+    result = await db.execute(
+        delete(RestaurantDB)
+        .where(RestaurantDB.id == restaurant_id)
+        .returning(RestaurantDB.id)
+    )
+    deleted = result.scalar_one_or_none() is not None
     await db.commit()
-    return True
+    stats_cache.clear()
+    return deleted
+
+
+@lru_cache(maxsize=32)
+def _insert_values_sql(rows: int) -> str:
+    """
+    Build a multi-row INSERT of `rows` COPY_COLUMNS records (qmark style).
+
+    Args:
+        rows: Number of VALUES tuples in the statement
+
+    Returns:
+        Raw SQL string
+    """
+    placeholders = "(" + ", ".join("?" * len(COPY_COLUMNS)) + ")"
+    return (
+        f"INSERT INTO {RestaurantDB.__tablename__} ({', '.join(COPY_COLUMNS)}) "
+        f"VALUES {', '.join([placeholders] * rows)}"
+    )
+
+
+async def _insert_records(
+    conn: AsyncConnection, records: Sequence[Tuple[Any, ...]]
+) -> None:
+    """
+    Insert records with the cheapest INSERT form the driver supports.
+
+    SQLite gets one multi-row VALUES statement per SQLITE_INSERT_PAGE_SIZE
+    records instead of stepping a statement once per row; other drivers get
+    an executemany INSERT, which asyncpg already pipelines.
+
+    Args:
+        conn: Connection inside the caller's transaction
+        records: Record tuples in COPY_COLUMNS order
+    """
+    table = RestaurantDB.__table__
+    if conn.dialect.name != "sqlite":
+        await conn.execute(
+            insert(table), [dict(zip(COPY_COLUMNS, record)) for record in records]
+        )
+        return
+
+    # Raw SQL skips SQLAlchemy's parameter handling, so apply the column
+    # types' bind processors (e.g. DateTime -> string) here
+    processors = [
+        (i, processor)
+        for i, name in enumerate(COPY_COLUMNS)
+        if (
+            processor := table.c[name]
+            .type.dialect_impl(conn.dialect)
+            .bind_processor(conn.dialect)
+        )
+    ]
+    for start in range(0, len(records), SQLITE_INSERT_PAGE_SIZE):
+        page = records[start : start + SQLITE_INSERT_PAGE_SIZE]
+        params: List[Any] = []
+        for record in page:
+            record = list(record)
+            for i, processor in processors:
+                record[i] = processor(record[i])
+            params.extend(record)
+        await conn.exec_driver_sql(_insert_values_sql(len(page)), tuple(params))
 
 
 async def bulk_create_restaurants(
     db: AsyncSession,
-    restaurants: List[Restaurant],
+    restaurants: Sequence[Union[Restaurant, Dict[str, Any]]],
+    commit: bool = True,
 ) -> int:
     """
     Bulk insert multiple restaurants.
 
     Args:
         db: Database session
-        restaurants: List of Pydantic Restaurant models
+        restaurants: Pydantic Restaurant models, or plain dicts with the same
+            fields (skips building and dumping a model per row)
+        commit: Commit (and clear stats_cache) when done. Pass False when
+            the caller owns the transaction; it must then call
+            stats_cache.clear() after its own commit, since clearing
+            earlier lets a concurrent read re-cache the old data
 
     Returns:
         Number of restaurants created
     """
-    db_restaurants = [
-        RestaurantDB(
-            id=r.id,
-            name=r.name,
-            address=r.address,
-            lat=r.lat,
-            lng=r.lng,
-            rating=r.rating,
-            price_level=r.price_level,
-            cuisine=r.cuisine,
-            source=r.source,
-            url=r.url,
-            num_reviews=r.num_reviews,
-        )
-        for r in restaurants
-    ]
+    if not restaurants:
+        return 0
+
+    now = datetime.utcnow()
+    records = []
+    for r in restaurants:
+        data = r.model_dump() if isinstance(r, Restaurant) else r
+        row = [data.get(name, default) for name, default in _ROW_DEFAULTS.items()]
+        records.append((*row, _city_from_address(data["address"]), now, now))
+
+    # Inserts in the session's transaction without building ORM instances or
+    # walking the unit of work for each row
+    await _insert_records(await db.connection(), records)
+    if commit:
+        await db.commit()
+        stats_cache.clear()
+    return len(records)
+
+
+def _record_chunks(
+    rows: Iterable[Tuple[Any, ...]], size: int = COPY_CHUNK_SIZE
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """
+    Turn row tuples into COPY_COLUMNS records, `size` at a time.
 
-    db.add_all(db_restaurants)
-    await db.commit()
-    return len(db_restaurants)
+    Args:
+        rows: Tuples of values in RESTAURANT_ROW_FIELDS order
+        size: Maximum records per chunk
+
+    Yields:
+        Lists of record tuples in COPY_COLUMNS order
+    """
+    now = datetime.utcnow()
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield [
+            (*row, _city_from_address(row[_ADDRESS_INDEX]), now, now) for row in chunk
+        ]
+
+
+def _csv_buffer(records: List[Tuple[Any, ...]]) -> io.BytesIO:
+    """
+    Serialize records as a tab-delimited CSV buffer for COPY ... FROM STDIN.
+
+    Args:
+        records: Record tuples in COPY_COLUMNS order
+
+    Returns:
+        Buffer positioned at the start
+    """
+    text = io.StringIO()
+    csv.writer(text, delimiter="\t", lineterminator="\n").writerows(records)
+    return io.BytesIO(text.getvalue().encode())
+
+
+async def bulk_copy_restaurants(
+    db: AsyncSession,
+    rows: Iterable[Tuple[Any, ...]],
+    commit: bool = True,
+) -> int:
+    """
+    Bulk insert raw restaurant rows, bypassing the ORM entirely.
+
+    Rows are consumed lazily in chunks of COPY_CHUNK_SIZE, so a generator
+    can feed an arbitrarily large load in bounded memory. On PostgreSQL
+    with asyncpg each chunk is streamed as a CSV buffer with COPY FROM
+    STDIN; other databases insert each chunk through _insert_records. All
+    chunks share the session's transaction.
+
+    Args:
+        db: Database session
+        rows: Tuples of values in RESTAURANT_ROW_FIELDS order
+        commit: Commit (and clear stats_cache) when done. Pass False when
+            the caller owns the transaction; it must then call
+            stats_cache.clear() after its own commit, since clearing
+            earlier lets a concurrent read re-cache the old data
+
+    Returns:
+        Number of restaurants created
+    """
+    conn = await db.connection()
+    copy_to_table = None
+    if conn.dialect.driver == "asyncpg":
+        # SQLAlchemy's asyncpg adapter only sends BEGIN before the first
+        # statement run through it; a raw COPY issued first would autocommit
+        # each chunk on its own
+        await conn.exec_driver_sql("SELECT 1")
+        raw = await conn.get_raw_connection()
+        copy_to_table = raw.driver_connection.copy_to_table
+
+    inserted = 0
+    for records in _record_chunks(rows):
+        if copy_to_table is not None:
+            await copy_to_table(
+                RestaurantDB.__tablename__,
+                source=_csv_buffer(records),
+                columns=COPY_COLUMNS,
+                format="csv",
+                delimiter="\t",
+            )
+        else:
+            await _insert_records(conn, records)
+        inserted += len(records)
+
+    if not inserted:
+        return 0
+    if commit:
+        await db.commit()
+        stats_cache.clear()
+    return inserted
 
 
 async def get_restaurant_count(db: AsyncSession) -> int:
@@ -5,7 +5,7 @@ SQLAlchemy models for the Restaurant Picker application.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Float, Integer, String
+from sqlalchemy import DateTime, Float, Index, Integer, String, column, func, table
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -27,15 +27,13 @@ class RestaurantDB(Base):
     # Required fields
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     address: Mapped[str] = mapped_column(String(500), nullable=False)
-    lat: Mapped[float] = mapped_column(Float, nullable=False, index=True)
+    lat: Mapped[float] = mapped_column(Float, nullable=False)
     lng: Mapped[float] = mapped_column(Float, nullable=False, index=True)
 
     # Optional fields
     rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     price_level: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    cuisine: Mapped[Optional[str]] = mapped_column(
-        String(100), nullable=True, index=True
-    )
+    cuisine: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     source: Mapped[str] = mapped_column(String(50), nullable=False, default="manual")
     url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     num_reviews: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -72,3 +70,38 @@ class RestaurantDB(Base):
             "city": self.city,
             "country": self.country,
         }
+
+
+# Search indexes for crud.search_restaurants. The lower() expression indexes
+# match its case-insensitive filters exactly, and the rank index lets SQLite
+# walk rows in ORDER BY order instead of sorting the whole result.
+Index(
+    "ix_restaurants_city_lower",
+    func.lower(RestaurantDB.city),
+    sqlite_where=func.lower(RestaurantDB.city).is_not(None),
+)
+# Cuisine filter + ranking: SQLite seeks to the cuisine and then reads rows
+# already in ORDER BY order, so LIMIT stops early without a sort.
+Index(
+    "ix_restaurants_cuisine_rank",
+    func.lower(RestaurantDB.cuisine),
+    RestaurantDB.rating.desc(),
+    RestaurantDB.num_reviews.desc(),
+)
+Index(
+    "ix_restaurants_rank",
+    RestaurantDB.rating.desc(),
+    RestaurantDB.num_reviews.desc(),
+)
+# Bounding-box lookups in crud.search_restaurants_near_point; also covers
+# lat-only lookups, so lat has no single-column index of its own.
+Index("ix_restaurants_lat_lng", RestaurantDB.lat, RestaurantDB.lng)
+
+
+# Lightweight handle on the SQLite FTS5 table created by init_db (see
+# app.db.base). The hidden column named after the table is the MATCH target.
+restaurants_fts = table(
+    "restaurants_fts",
+    column("rowid"),
+    column("restaurants_fts"),
+)
@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api import health, restaurants
 from app.core.config import settings
@@ -14,7 +16,14 @@ async def lifespan(app: FastAPI):
     Lifespan context manager for FastAPI.
     Runs on startup and shutdown.
     """
-    # Startup: Initialize database
+    # Startup: a dedicated pool for CPU-bound /restaurants/pick work, so it
+    # cannot starve the loop's default executor (to_thread, DNS lookups)
+    app.state.pick_executor = ThreadPoolExecutor(
+        max_workers=settings.pick_executor_max_workers,
+        thread_name_prefix="pick",
+    )
+
+    # Initialize database
     print("Initializing database...")
     await init_db()
     print("Database initialized!")
@@ -23,8 +32,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: cleanup if needed
     print("Shutting down...")
+    app.state.pick_executor.shutdown(wait=False, cancel_futures=True)
 
 
+# No custom default_response_class: every route declares a response_model,
+# which lets current FastAPI serialize straight to JSON bytes with
+# pydantic-core. Setting ORJSONResponse here would turn that path off.
 app = FastAPI(
     title=settings.app_name,
     version="0.1.0",
@@ -38,6 +51,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Restaurant lists are repetitive JSON and compress several-fold
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
 app.include_router(health.router)
 app.include_router(restaurants.router)
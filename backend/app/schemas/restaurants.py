@@ -1,14 +1,26 @@
-from typing import List
+from typing import List, Union
 
 from pydantic import BaseModel
+from sqlalchemy import Row
 
+from app.db.models import RestaurantDB
 from app.models.restaurant import Restaurant
 
 
 class RestaurantOut(Restaurant):
     """Response schema for a restaurant"""
 
-    pass
+    @classmethod
+    def from_db(cls, db_obj: Union[RestaurantDB, Row]) -> "RestaurantOut":
+        """Build from a database row without re-running validation.
+
+        Accepts an ORM instance or a column Row (see
+        crud.RESTAURANT_OUT_COLUMNS). The column types already match the
+        schema, so model_construct skips the per-field validators.
+        """
+        return cls.model_construct(
+            **{name: getattr(db_obj, name) for name in cls.model_fields}
+        )
 
 
 class PickRequest(BaseModel):
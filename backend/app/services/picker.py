@@ -1,3 +1,5 @@
+import heapq
+import math
 import random
 from typing import List
 
@@ -33,28 +35,17 @@ def pick_restaurants(
 
     limit = max(1, min(limit, len(restaurants)))
 
-    if strategy == "top":
-        sorted_restaurants = sorted(restaurants, key=score_restaurant, reverse=True)
-        return sorted_restaurants[:limit]
-
-    # Default: weighted random
-    scores = [max(score_restaurant(r), 0.01) for r in restaurants]
-    total = sum(scores)
-    weights = [s / total for s in scores]
-
-    chosen: List[Restaurant] = []
-    available = restaurants.copy()
-    available_weights = weights.copy()
-
-    for _ in range(limit):
-        r = random.choices(available, weights=available_weights, k=1)[0]
-        chosen.append(r)
+    # Score every candidate exactly once
+    scores = [score_restaurant(r) for r in restaurants]
 
-        idx = available.index(r)
-        available.pop(idx)
-        available_weights.pop(idx)
-
-        if not available:
-            break
-
-    return chosen
+    if strategy == "top":
+        # Partial selection: O(N log limit) instead of sorting everything
+        best = heapq.nlargest(limit, range(len(restaurants)), key=scores.__getitem__)
+        return [restaurants[i] for i in best]
+
+    # Default: weighted random sampling without replacement
+    # (Efraimidis-Spirakis): give each candidate the key log(u) / weight with
+    # u uniform in (0, 1] and keep the `limit` largest keys, in one pass.
+    keys = [math.log(1.0 - random.random()) / max(s, 0.01) for s in scores]
+    chosen = heapq.nlargest(limit, range(len(restaurants)), key=keys.__getitem__)
+    return [restaurants[i] for i in chosen]
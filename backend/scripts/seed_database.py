@@ -5,12 +5,21 @@ This script populates the database with sample restaurant data.
 You can run this weekly to update your restaurant database.
 
 Usage:
-    python -m scripts.seed_database
+    python -m scripts.seed_database [count] [seed]
 """
 
 import asyncio
+import multiprocessing
+import os
+import random
 import sys
+import threading
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Optional
 
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -18,15 +27,162 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from faker import Faker
 
 from app.db.base import AsyncSessionLocal, init_db
-from app.db.crud import bulk_create_restaurants, get_restaurant_count
-from app.models.restaurant import Restaurant
+from app.db.crud import (
+    RESTAURANT_ROW_FIELDS,
+    bulk_copy_restaurants,
+    bulk_create_restaurants,
+    get_restaurant_count,
+)
+
+# Only load the providers the pools draw from (company, street_address and
+# url are built on person names), and pick elements uniformly rather than by
+# locale frequency weights
+FAKER_PROVIDERS = [
+    "faker.providers.person",
+    "faker.providers.company",
+    "faker.providers.address",
+    "faker.providers.internet",
+]
+fake = Faker(providers=FAKER_PROVIDERS, use_weighting=False)
+
+CUISINES = (
+    "italian",
+    "japanese",
+    "chinese",
+    "mexican",
+    "indian",
+    "thai",
+    "french",
+    "american",
+    "mediterranean",
+    "korean",
+    "vietnamese",
+    "greek",
+    "spanish",
+    "brazilian",
+    "fast food",
+    "pizza",
+    "sushi",
+    "bbq",
+    "seafood",
+    "vegetarian",
+)
+
+CITIES = (
+    "New York",
+    "Los Angeles",
+    "Chicago",
+    "Houston",
+    "Phoenix",
+    "Philadelphia",
+    "San Antonio",
+    "San Diego",
+    "Dallas",
+    "San Jose",
+    "Austin",
+    "Seattle",
+    "Denver",
+    "Boston",
+    "Portland",
+    "Miami",
+    "Atlanta",
+    "San Francisco",
+    "Las Vegas",
+    "Washington DC",
+)
+
+# Approximate centres for the cities we place restaurants around
+CITY_CENTROIDS: dict[str, tuple[float, float]] = {
+    "New York": (40.7128, -74.0060),
+    "Los Angeles": (34.0522, -118.2437),
+    "Chicago": (41.8781, -87.6298),
+    "San Francisco": (37.7749, -122.4194),
+}
+
+NAME_SUFFIXES = ("Restaurant", "Bistro", "Cafe", "Grill", "Kitchen", "House", "Bar")
+
+# Pre-joined separators, so each name and address is a single concatenation
+SUFFIX_POOL = tuple(" " + suffix for suffix in NAME_SUFFIXES)
+CITY_ADDR_SUFFIX = {city: ", " + city for city in CITIES}
+
+DEFAULT_SEED_COUNT = 100
+# Above this many rows, insert through bulk_copy_restaurants (COPY / raw
+# executemany) instead of the Restaurant-model path
+COPY_THRESHOLD = 100
+# Above this many rows, generation is split across CPU cores
+PARALLEL_THRESHOLD = 20_000
+# Rows generated and inserted per batch on the bulk path, so large seeds run
+# in constant memory
+SEED_CHUNK_SIZE = 5000
+# Generated batches allowed to wait for the inserter; bounds memory to about
+# this many batches while generation runs ahead
+SEED_QUEUE_DEPTH = 2
+
+# Faker is slow per call, so small pools of its output are built once (see
+# build_pools) and rows are sampled from them
+POOL_SIZE = 2048
+COMPANIES: list[str] = []
+STREETS: list[str] = []
+URLS: list[str] = []
+
+
+def batched(iterable: Iterable, n: int) -> Iterator[tuple]:
+    """Yield tuples of up to n items (itertools.batched is Python 3.12+)."""
+    it = iter(iterable)
+    while batch := tuple(islice(it, n)):
+        yield batch
+
+
+def build_pools() -> None:
+    """Fill the Faker pools on first use; later calls are no-ops."""
+    if COMPANIES:
+        return
+    STREETS.extend(fake.street_address() for _ in range(POOL_SIZE))
+    URLS.extend(fake.url() for _ in range(POOL_SIZE))
+    # Filled last, so a non-empty COMPANIES means every pool is ready
+    COMPANIES.extend(fake.company() for _ in range(POOL_SIZE))
+
+
+def _gen_coords(
+    city_col: list[str], rng: random.Random
+) -> tuple[list[float], list[float]]:
+    """
+    Generate a coordinate for each city in a column of city names.
 
-fake = Faker()
+    Cities in CITY_CENTROIDS get a point near their centre; the rest land
+    somewhere in the continental US (rough approximation - in production,
+    use actual geocoding).
 
+    Args:
+        city_col: City name per row
+        rng: Random source
 
-def generate_sample_restaurants(count: int = 100) -> list[Restaurant]:
+    Returns:
+        Latitude and longitude columns, aligned with city_col
     """
-    Generate sample restaurant data using Faker.
+    uniform = rng.uniform
+    lat_col: list[float] = []
+    lng_col: list[float] = []
+
+    for city in city_col:
+        centroid = CITY_CENTROIDS.get(city)
+        if centroid:
+            lat = centroid[0] + uniform(-0.1, 0.1)
+            lng = centroid[1] + uniform(-0.1, 0.1)
+        else:
+            # Default to somewhere in the US
+            lat, lng = uniform(25.0, 48.0), uniform(-125.0, -65.0)
+        lat_col.append(lat)
+        lng_col.append(lng)
+
+    return lat_col, lng_col
+
+
+def generate_sample_rows(
+    count: int = 100, start: int = 0, seed: Optional[int] = None
+) -> list[tuple]:
+    """
+    Generate sample restaurant data using Faker, as plain tuples.
 
     In production, replace this with:
     - CSV import
@@ -35,132 +191,237 @@ def generate_sample_restaurants(count: int = 100) -> list[Restaurant]:
 
     Args:
         count: Number of restaurants to generate
+        start: Offset for the generated ids (restaurant_{start + 1}, ...)
+        seed: Seed for reproducible output; None draws fresh randomness
 
     Returns:
-        List of Restaurant objects
+        List of tuples in RESTAURANT_ROW_FIELDS order
     """
-    cuisines = [
-        "italian",
-        "japanese",
-        "chinese",
-        "mexican",
-        "indian",
-        "thai",
-        "french",
-        "american",
-        "mediterranean",
-        "korean",
-        "vietnamese",
-        "greek",
-        "spanish",
-        "brazilian",
-        "fast food",
-        "pizza",
-        "sushi",
-        "bbq",
-        "seafood",
-        "vegetarian",
-    ]
+    build_pools()
+    rows = []
+
+    # Draw every independent column in one call each instead of several
+    # Faker dispatches per row, from a private RNG with its methods bound
+    # to locals
+    rng = random.Random(seed)
+    choices = rng.choices
+    uniform = rng.uniform
+    city_col = choices(CITIES, k=count)
+    cuisine_col = choices(CUISINES, k=count)
+    company_col = choices(COMPANIES, k=count)
+    street_col = choices(STREETS, k=count)
+    url_col = choices(URLS, k=count)
+    suffix_col = choices(SUFFIX_POOL, k=count)
+    rating_col = [round(uniform(3.0, 5.0), 1) for _ in range(count)]
+    price_col = choices(range(1, 5), k=count)
+    reviews_col = choices(range(10, 501), k=count)
+
+    lat_col, lng_col = _gen_coords(city_col, rng)
+
+    for i, city in enumerate(city_col):
+        rows.append(
+            (
+                f"restaurant_{start + i + 1}",  # id
+                company_col[i] + suffix_col[i],  # name
+                street_col[i] + CITY_ADDR_SUFFIX[city],  # address
+                lat_col[i],  # lat
+                lng_col[i],  # lng
+                rating_col[i],
+                price_col[i],
+                cuisine_col[i],
+                "seed_script",  # source
+                url_col[i],  # url
+                reviews_col[i],  # num_reviews
+            )
+        )
 
-    cities = [
-        "New York",
-        "Los Angeles",
-        "Chicago",
-        "Houston",
-        "Phoenix",
-        "Philadelphia",
-        "San Antonio",
-        "San Diego",
-        "Dallas",
-        "San Jose",
-        "Austin",
-        "Seattle",
-        "Denver",
-        "Boston",
-        "Portland",
-        "Miami",
-        "Atlanta",
-        "San Francisco",
-        "Las Vegas",
-        "Washington DC",
-    ]
+    return rows
 
-    restaurants = []
 
-    for i in range(count):
-        city = fake.random_element(elements=cities)
-        cuisine = fake.random_element(elements=cuisines)
+def _chunk_seed(seed: Optional[int], start: int) -> Optional[int]:
+    """Seed for the chunk starting at `start`, so chunks differ but repeat."""
+    return None if seed is None else seed + start
 
-        # Generate realistic coordinates for US cities (rough approximation)
-        # In production, use actual geocoding
-        if city == "New York":
-            lat, lng = (
-                40.7128 + fake.random.uniform(-0.1, 0.1),
-                -74.0060 + fake.random.uniform(-0.1, 0.1),
-            )
-        elif city == "Los Angeles":
-            lat, lng = (
-                34.0522 + fake.random.uniform(-0.1, 0.1),
-                -118.2437 + fake.random.uniform(-0.1, 0.1),
-            )
-        elif city == "Chicago":
-            lat, lng = (
-                41.8781 + fake.random.uniform(-0.1, 0.1),
-                -87.6298 + fake.random.uniform(-0.1, 0.1),
-            )
-        elif city == "San Francisco":
-            lat, lng = (
-                37.7749 + fake.random.uniform(-0.1, 0.1),
-                -122.4194 + fake.random.uniform(-0.1, 0.1),
-            )
-        else:
-            # Default to somewhere in the US
-            lat = fake.random.uniform(25.0, 48.0)
-            lng = fake.random.uniform(-125.0, -65.0)
-
-        restaurant = Restaurant(
-            id=f"restaurant_{i + 1}",
-            name=fake.company()
-            + " "
-            + fake.random_element(
-                elements=[
-                    "Restaurant",
-                    "Bistro",
-                    "Cafe",
-                    "Grill",
-                    "Kitchen",
-                    "House",
-                    "Bar",
-                ]
-            ),
-            address=fake.street_address() + ", " + city,
-            lat=lat,
-            lng=lng,
-            rating=round(fake.random.uniform(3.0, 5.0), 1),
-            price_level=fake.random_int(min=1, max=4),
-            cuisine=cuisine,
-            source="seed_script",
-            url=fake.url(),
-            num_reviews=fake.random_int(min=10, max=500),
+
+def iter_sample_rows(
+    count: int, start: int = 0, seed: Optional[int] = None
+) -> Iterator[tuple]:
+    """
+    Lazily generate sample rows, SEED_CHUNK_SIZE at a time.
+
+    Args:
+        count: Number of restaurants to generate
+        start: Offset for the generated ids
+        seed: Seed for reproducible output; None draws fresh randomness
+
+    Yields:
+        Tuples in RESTAURANT_ROW_FIELDS order
+    """
+    for offset in range(start, start + count, SEED_CHUNK_SIZE):
+        yield from generate_sample_rows(
+            min(SEED_CHUNK_SIZE, start + count - offset),
+            start=offset,
+            seed=_chunk_seed(seed, offset),
+        )
+
+
+def _gen_shard(shard: tuple[int, int, Optional[int]]) -> list[tuple]:
+    """Worker process entry point: generate `count` rows from id offset `start`."""
+    start, count, seed = shard
+    return generate_sample_rows(count, start=start, seed=_chunk_seed(seed, start))
+
+
+def _init_worker(companies: list[str], streets: list[str], urls: list[str]) -> None:
+    """Worker process initializer: install the parent's Faker pools."""
+    STREETS[:] = streets
+    URLS[:] = urls
+    COMPANIES[:] = companies  # last, as in build_pools
+
+
+def iter_sample_rows_parallel(
+    count: int, seed: Optional[int] = None
+) -> Iterator[tuple]:
+    """
+    Generate sample rows on every CPU core with a process pool.
+
+    Faker is pure Python and holds the GIL, so threads would not help. Work
+    is split into SEED_CHUNK_SIZE shards whose rows are yielded in order.
+    Only one shard per worker plus one is in flight at a time, so finished
+    shards cannot pile up while the consumer is busy inserting.
+
+    Workers are spawned rather than forked: this runs in insert_batches'
+    producer thread, and forking a process with other threads running (the
+    event loop, aiosqlite's connection thread) can deadlock the child. The
+    Faker pools are handed to each worker so all shards sample the same
+    pools.
+
+    Args:
+        count: Number of restaurants to generate
+        seed: Seed for reproducible output; None draws fresh randomness
+
+    Yields:
+        Tuples in RESTAURANT_ROW_FIELDS order
+    """
+    workers = os.cpu_count() or 1
+    shards = (
+        (start, min(SEED_CHUNK_SIZE, count - start), seed)
+        for start in range(0, count, SEED_CHUNK_SIZE)
+    )
+
+    build_pools()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(COMPANIES, STREETS, URLS),
+    )
+    try:
+        in_flight = deque(
+            executor.submit(_gen_shard, shard) for shard in islice(shards, workers + 1)
         )
-        restaurants.append(restaurant)
+        while in_flight:
+            rows = in_flight.popleft().result()
+            for shard in islice(shards, 1):
+                in_flight.append(executor.submit(_gen_shard, shard))
+            yield from rows
+    finally:
+        # On close() or an error, drop queued shards instead of finishing them
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def generate_sample_restaurants(
+    count: int = 100, seed: Optional[int] = None
+) -> list[dict]:
+    """
+    Generate sample restaurant data as plain dicts.
+
+    Args:
+        count: Number of restaurants to generate
+        seed: Seed for reproducible output; None draws fresh randomness
+
+    Returns:
+        List of dicts keyed by RESTAURANT_ROW_FIELDS
+    """
+    return [
+        dict(zip(RESTAURANT_ROW_FIELDS, row))
+        for row in generate_sample_rows(count, seed=seed)
+    ]
+
 
-    return restaurants
+async def insert_batches(session, rows: Generator[tuple, None, None]) -> int:
+    """
+    Insert rows batch by batch while later batches are still being generated.
 
+    Generation is CPU-bound and runs in a producer thread that puts batches
+    on a bounded queue; this coroutine inserts them as they arrive, so the
+    two phases overlap instead of running back to back.
 
-async def seed_database():
-    """Main function to seed the database."""
+    Args:
+        session: Database session; the caller owns the transaction
+        rows: Generator of tuples in RESTAURANT_ROW_FIELDS order; closed
+            when done, so its cleanup (e.g. a process pool) runs promptly
+
+    Returns:
+        Number of restaurants inserted
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SEED_QUEUE_DEPTH)
+    stop = threading.Event()
+
+    def put(item) -> None:
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    def fill_queue() -> None:
+        try:
+            for chunk in batched(rows, SEED_CHUNK_SIZE):
+                if stop.is_set():
+                    return
+                put(chunk)
+        finally:
+            # Sentinel: no more batches (also after a generation error). Not
+            # sent once the consumer has stopped, as nothing would read it.
+            if not stop.is_set():
+                put(None)
+
+    producer = asyncio.create_task(asyncio.to_thread(fill_queue))
+    inserted = 0
+    try:
+        while (chunk := await queue.get()) is not None:
+            inserted += await bulk_copy_restaurants(session, chunk, commit=False)
+        await producer  # re-raise any generation error
+    except BaseException:
+        # Keep draining so a producer blocked on the full queue can exit
+        stop.set()
+        while not producer.done():
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.sleep(0.01)
+        raise
+    finally:
+        # Run the generator's cleanup now rather than whenever it is garbage
+        # collected (it cannot be closed while the producer still runs it)
+        if producer.done():
+            rows.close()
+    return inserted
+
+
+async def seed_database(count: int = DEFAULT_SEED_COUNT, seed: Optional[int] = None):
+    """Main function to seed the database. A seed makes the data reproducible."""
     print("=" * 60)
     print("Restaurant Picker - Database Seeding Script")
     print("=" * 60)
 
     # Initialize database (create tables if they don't exist)
     print("\n[1/4] Initializing database...")
-    await init_db()
+    # Build the Faker pools in a thread while the tables are created
+    if seed is not None:
+        fake.seed_instance(seed)
+    await asyncio.gather(init_db(), asyncio.to_thread(build_pools))
     print("✓ Database initialized")
 
-    # Check current count
-    async with AsyncSessionLocal() as session:
+    # Check current count. Everything below runs in one transaction, so the
+    # whole seed costs a single commit.
+    async with AsyncSessionLocal() as session, session.begin():
         current_count = await get_restaurant_count(session)
         print(f"\n[2/4] Current restaurant count: {current_count}")
 
@@ -172,14 +433,28 @@ async def seed_database():
                 print("Seeding cancelled.")
                 return
 
-        # Generate sample data
-        print("\n[3/4] Generating sample restaurants...")
-        restaurants = generate_sample_restaurants(count=100)
-        print(f"✓ Generated {len(restaurants)} sample restaurants")
+        if count > COPY_THRESHOLD:
+            # Large seeds insert raw row tuples, each batch while the next
+            # one is generated
+            print(
+                f"\n[3/4] Generating sample restaurants in batches of "
+                f"{SEED_CHUNK_SIZE}..."
+            )
+            if count > PARALLEL_THRESHOLD:
+                rows = iter_sample_rows_parallel(count, seed=seed)
+            else:
+                rows = iter_sample_rows(count, seed=seed)
+            print("\n[4/4] Inserting restaurants into database...")
+            inserted_count = await insert_batches(session, rows)
+        else:
+            print("\n[3/4] Generating sample restaurants...")
+            restaurants = generate_sample_restaurants(count=count, seed=seed)
+            print(f"✓ Generated {count} sample restaurants")
 
-        # Insert into database
-        print("\n[4/4] Inserting restaurants into database...")
-        inserted_count = await bulk_create_restaurants(session, restaurants)
+            print("\n[4/4] Inserting restaurants into database...")
+            inserted_count = await bulk_create_restaurants(
+                session, restaurants, commit=False
+            )
         print(f"✓ Inserted {inserted_count} restaurants")
 
         # Show final count
@@ -199,8 +474,10 @@ async def seed_database():
 
 def main():
     """Entry point for the script."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SEED_COUNT
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
     try:
-        asyncio.run(seed_database())
+        asyncio.run(seed_database(count, seed))
     except KeyboardInterrupt:
         print("\n\nSeeding interrupted by user.")
         sys.exit(1)
@@ -0,0 +1,25 @@
+"""
+Shared fixtures: every test runs against a fresh SQLite database file.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+# Point the app at a throwaway database before any app module is imported
+_DB_DIR = tempfile.mkdtemp(prefix="restaurant_picker_tests_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(_DB_DIR) / 'test.db'}"
+
+import pytest_asyncio  # noqa: E402
+
+from app.db.base import AsyncSessionLocal, drop_db, engine, init_db  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Session on an empty, freshly initialized database."""
+    await drop_db()
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        yield session
+    await engine.dispose()
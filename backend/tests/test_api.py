@@ -0,0 +1,46 @@
+"""
+Tests for the HTTP API, run through the app lifespan.
+"""
+
+import threading
+
+from fastapi.testclient import TestClient
+
+from app.api import restaurants
+from app.core.config import settings
+from app.main import app
+
+
+def _candidates(count: int) -> list:
+    return [
+        {
+            "id": f"r{i}",
+            "name": f"Place {i}",
+            "address": "1 Main St, Boston",
+            "lat": 0.0,
+            "lng": 0.0,
+            "rating": 4.0,
+        }
+        for i in range(count)
+    ]
+
+
+def test_large_pick_runs_in_dedicated_pool(monkeypatch):
+    threads = []
+    pick_restaurants = restaurants.pick_restaurants
+
+    def recording_pick(**kwargs):
+        threads.append(threading.current_thread().name)
+        return pick_restaurants(**kwargs)
+
+    monkeypatch.setattr(restaurants, "pick_restaurants", recording_pick)
+    count = settings.pick_offload_threshold + 1
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/restaurants/pick", json={"candidates": _candidates(count), "limit": 2}
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert threads[0].startswith("pick")
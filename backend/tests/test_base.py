@@ -0,0 +1,39 @@
+"""
+Tests for database initialization on existing databases.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.db.base import REPLACED_INDEXES, init_db
+from app.db.models import RestaurantDB
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _index_names(db) -> set:
+    result = await db.execute(
+        text(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'restaurants'"
+        )
+    )
+    return set(result.scalars())
+
+
+async def test_init_db_migrates_indexes_of_existing_table(db):
+    model_indexes = {index.name for index in RestaurantDB.__table__.indexes}
+    # Make the table look like one created by an older schema
+    for name in model_indexes:
+        await db.execute(text(f"DROP INDEX {name}"))
+    await db.execute(text("CREATE INDEX ix_restaurants_lat ON restaurants (lat)"))
+    await db.execute(
+        text("CREATE INDEX ix_restaurants_cuisine ON restaurants (cuisine)")
+    )
+    await db.commit()
+
+    await init_db()
+
+    names = await _index_names(db)
+    assert model_indexes <= names
+    assert not names & set(REPLACED_INDEXES)
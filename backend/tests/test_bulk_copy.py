@@ -0,0 +1,96 @@
+"""
+Tests for bulk_copy_restaurants on the asyncpg COPY path, against fakes that
+mimic asyncpg's autocommit behaviour (no PostgreSQL server needed).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.crud import COPY_CHUNK_SIZE, bulk_copy_restaurants
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeAsyncpgConnection:
+    """COPY outside a BEGIN commits at once, like a real asyncpg connection."""
+
+    def __init__(self, fail_on_copy=None):
+        self.fail_on_copy = fail_on_copy
+        self.in_transaction = False
+        self.copies = 0
+        self.pending = 0
+        self.committed = 0
+
+    async def copy_to_table(self, table, *, source, columns, format, delimiter):
+        self.copies += 1
+        if self.copies == self.fail_on_copy:
+            raise RuntimeError("copy failed")
+        rows = source.getvalue().count(b"\n")
+        if self.in_transaction:
+            self.pending += rows
+        else:
+            self.committed += rows
+
+
+class FakeConnection:
+    """SQLAlchemy AsyncConnection over the asyncpg adapter."""
+
+    dialect = SimpleNamespace(name="postgresql", driver="asyncpg")
+
+    def __init__(self, driver_connection):
+        self.driver_connection = driver_connection
+
+    async def exec_driver_sql(self, statement):
+        # The adapter sends BEGIN ahead of the first statement it runs
+        self.driver_connection.in_transaction = True
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self.driver_connection)
+
+
+class FakeSession:
+    def __init__(self, driver_connection):
+        self.pg = driver_connection
+        self.conn = FakeConnection(driver_connection)
+
+    async def connection(self):
+        return self.conn
+
+    async def commit(self):
+        self.pg.committed += self.pg.pending
+        self.pg.pending = 0
+        self.pg.in_transaction = False
+
+    async def rollback(self):
+        self.pg.pending = 0
+        self.pg.in_transaction = False
+
+
+def _rows(count):
+    return [
+        (f"r{i}", "Place", "1 Main St, Boston", 0.0, 0.0, 4.0, 2, "thai", "t", None, 1)
+        for i in range(count)
+    ]
+
+
+async def test_bulk_copy_commits_all_chunks_together():
+    pg = FakeAsyncpgConnection()
+    session = FakeSession(pg)
+
+    inserted = await bulk_copy_restaurants(session, _rows(COPY_CHUNK_SIZE + 1))
+
+    assert inserted == COPY_CHUNK_SIZE + 1
+    assert pg.copies == 2
+    assert pg.committed == COPY_CHUNK_SIZE + 1
+
+
+async def test_bulk_copy_failure_rolls_back_earlier_chunks():
+    pg = FakeAsyncpgConnection(fail_on_copy=2)
+    session = FakeSession(pg)
+
+    with pytest.raises(RuntimeError):
+        await bulk_copy_restaurants(session, _rows(COPY_CHUNK_SIZE + 1))
+    await session.rollback()
+
+    assert pg.committed == 0
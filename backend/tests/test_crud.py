@@ -0,0 +1,148 @@
+"""
+Tests for the restaurant CRUD helpers.
+"""
+
+import pytest
+from sqlalchemy import update
+
+from app.core.cache import stats_cache
+from app.db.base import init_db
+from app.db.crud import (
+    _city_from_address,
+    bulk_create_restaurants,
+    get_restaurant,
+    get_restaurants,
+    search_restaurants,
+    update_restaurant,
+)
+from app.db.models import RestaurantDB
+from app.models.restaurant import Restaurant
+
+
+def _restaurant(id: str, address: str = "1 Main St, Boston", **fields) -> Restaurant:
+    return Restaurant(
+        id=id, name=f"Place {id}", address=address, lat=0.0, lng=0.0, **fields
+    )
+
+
+@pytest.mark.parametrize(
+    ("address", "city"),
+    [
+        ("12 Main St, Boston", "Boston"),
+        ("12 Main St, Boston, MA", "Boston"),
+        ("3 Oak Ave, Springfield, IL 62704", "Springfield"),
+        ("3 Oak Ave, Springfield, IL 62704, USA", "Springfield"),
+        ("1600 Pennsylvania Ave NW, Washington, DC 20500-0003", "Washington"),
+        ("9 Pine Rd, Austin, Texas 78701, United States", "Austin"),
+        ("12 Main St, Boston, USA", "Boston"),
+        ("5 Elm St, Washington DC", "Washington DC"),
+        # Ambiguous or missing city
+        ("1 Rue de Rivoli, Paris, France", None),
+        ("Suite 5, 3 Oak Ave, Springfield", None),
+        ("1 Main St, 02134", None),
+        ("1 Main St", None),
+        ("", None),
+    ],
+)
+def test_city_from_address(address, city):
+    assert _city_from_address(address) == city
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_stores_parsed_city(db):
+    await bulk_create_restaurants(
+        db, [_restaurant("a", "3 Oak Ave, Springfield, IL 62704, USA")]
+    )
+
+    restaurant = await get_restaurant(db, "a")
+
+    assert restaurant.city == "Springfield"
+
+
+@pytest.mark.asyncio
+async def test_get_restaurants_paginates(db):
+    await bulk_create_restaurants(db, [_restaurant(f"r{i}") for i in range(5)])
+
+    page = await get_restaurants(db, skip=1, limit=3)
+
+    assert len(page) == 3
+    assert len(await get_restaurants(db)) == 5
+
+
+async def _clear_city(db, restaurant_id: str) -> None:
+    """Make a row look like one stored before city was populated."""
+    await db.execute(
+        update(RestaurantDB).where(RestaurantDB.id == restaurant_id).values(city=None)
+    )
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_search_city_includes_rows_without_city(db):
+    await bulk_create_restaurants(db, [_restaurant("old", "1 Main St, Boston")])
+    await _clear_city(db, "old")
+    await bulk_create_restaurants(db, [_restaurant("new", "2 Elm St, Boston")])
+
+    rows = await search_restaurants(db, location="Boston")
+
+    assert sorted(row.id for row in rows) == ["new", "old"]
+
+
+@pytest.mark.asyncio
+async def test_search_city_lists_exact_matches_first_and_respects_limit(db):
+    await bulk_create_restaurants(
+        db,
+        [
+            _restaurant("exact", "1 Main St, Boston", rating=3.0),
+            _restaurant("word", "2 Boston Ave, Denver", rating=5.0),
+            _restaurant("other", "3 Elm St, Denver", rating=4.0),
+        ],
+    )
+
+    assert [row.id for row in await search_restaurants(db, location="boston")] == [
+        "exact",
+        "word",
+    ]
+    assert [
+        row.id for row in await search_restaurants(db, location="boston", limit=1)
+    ] == ["exact"]
+
+
+@pytest.mark.asyncio
+async def test_init_db_backfills_missing_cities(db):
+    await bulk_create_restaurants(
+        db,
+        [
+            _restaurant("a", "3 Oak Ave, Springfield, IL 62704"),
+            _restaurant("b", "1 Rue de Rivoli, Paris, France"),
+        ],
+    )
+    await _clear_city(db, "a")
+
+    await init_db()
+
+    db.expire_all()
+    assert (await get_restaurant(db, "a")).city == "Springfield"
+    assert (await get_restaurant(db, "b")).city is None
+
+
+@pytest.mark.asyncio
+async def test_update_address_rederives_city(db):
+    await bulk_create_restaurants(db, [_restaurant("a", "1 Main St, Boston")])
+
+    updated = await update_restaurant(db, "a", address="2 Elm St, Denver, CO 80202")
+
+    assert updated.city == "Denver"
+    assert [row.id for row in await search_restaurants(db, location="denver")] == ["a"]
+    assert await search_restaurants(db, location="boston") == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_without_commit_leaves_stats_cache(db):
+    stats_cache.set("cities", ["Boston"])
+
+    await bulk_create_restaurants(db, [_restaurant("a")], commit=False)
+    assert stats_cache.get("cities") == ["Boston"]
+
+    await bulk_create_restaurants(db, [_restaurant("b")])
+    assert stats_cache.get("cities") is None
@@ -0,0 +1,42 @@
+"""
+Tests for the SQLite FTS5 location index.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.db.base import init_db
+from app.db.crud import bulk_create_restaurants, search_restaurants
+from app.models.restaurant import Restaurant
+
+pytestmark = pytest.mark.asyncio
+
+
+def _restaurant(id: str, address: str) -> Restaurant:
+    return Restaurant(id=id, name=f"Place {id}", address=address, lat=0.0, lng=0.0)
+
+
+async def test_fts_search_matches_address_words(db):
+    await bulk_create_restaurants(
+        db,
+        [_restaurant("a", "1 Harbor St, Boston"), _restaurant("b", "2 Elm St, Denver")],
+    )
+
+    rows = await search_restaurants(db, location="harbor")
+
+    assert [row.id for row in rows] == ["a"]
+
+
+async def test_init_db_rebuilds_out_of_sync_index(db):
+    await bulk_create_restaurants(db, [_restaurant("a", "1 Harbor St, Boston")])
+    # Simulate the index losing track of rowids (e.g. after a VACUUM)
+    await db.execute(
+        text("INSERT INTO restaurants_fts(restaurants_fts) VALUES ('delete-all')")
+    )
+    await db.commit()
+    assert await search_restaurants(db, location="harbor") == []
+
+    await init_db()
+
+    rows = await search_restaurants(db, location="harbor")
+    assert [row.id for row in rows] == ["a"]
@@ -0,0 +1,55 @@
+"""
+Tests for the batched insert pipeline of the seed script.
+"""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.db.crud import get_restaurant_count
+from scripts.seed_database import SEED_CHUNK_SIZE, insert_batches
+
+pytestmark = pytest.mark.asyncio
+
+
+def _rows(ids, cleanup: list):
+    try:
+        for restaurant_id in ids:
+            yield (
+                restaurant_id,
+                "Place",
+                "1 Main St, Boston",
+                0.0,
+                0.0,
+                4.0,
+                2,
+                "thai",
+                "test",
+                None,
+                1,
+            )
+    finally:
+        cleanup.append("closed")
+
+
+async def test_insert_batches_inserts_every_row_and_closes_rows(db):
+    cleanup = []
+    count = SEED_CHUNK_SIZE + 10
+
+    inserted = await insert_batches(db, _rows((f"r{i}" for i in range(count)), cleanup))
+    await db.commit()
+
+    assert inserted == count
+    assert await get_restaurant_count(db) == count
+    assert cleanup == ["closed"]
+
+
+async def test_insert_batches_closes_rows_when_an_insert_fails(db):
+    cleanup = []
+    # Every row has the same id, so the first batch fails; plenty of rows
+    # are left for a producer that would otherwise block on the full queue
+    rows = _rows(("dup" for _ in range(10 * SEED_CHUNK_SIZE)), cleanup)
+
+    with pytest.raises(IntegrityError):
+        await insert_batches(db, rows)
+
+    assert cleanup == ["closed"]